@@ -1,8 +1,12 @@
 from __future__ import annotations
-import os
-from typing import Any, Dict, List
+import asyncio, atexit, functools, hashlib, os, sqlite3, threading, weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from executor.connectors.openai_shared import reply_text, shared_async_http, shared_http
 
 load_dotenv()
 
@@ -10,39 +14,266 @@ DEFAULT_MODEL = os.getenv("ROUTER_MODEL") or os.getenv("DEFAULT_MODEL") or "gpt-
 BOOST_ENABLED = os.getenv("CORTEX_BOOST_ENABLED", "false").lower() in ("1", "true", "yes")
 BOOST_MODEL = os.getenv("CORTEX_BOOST_MODEL", "gpt-5")
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+# Opt-in: replies to byte-identical requests are served from memory
+PROMPT_CACHE_ENABLED = os.getenv("CORTEX_PROMPT_CACHE", "false").lower() in ("1", "true", "yes")
+PROMPT_CACHE_SIZE = 256
+# Opt-in: a paraphrase of an earlier question (same model, system prompt and
+# context) reuses that reply when the embeddings are this close
+SEMANTIC_CACHE_ENABLED = os.getenv("CORTEX_SEMANTIC_CACHE", "false").lower() in ("1", "true", "yes")
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("CORTEX_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+SEMANTIC_CACHE_SIZE = 1024
+# Semantic entries survive restarts: loaded on first lookup, written back at exit
+SEMANTIC_CACHE_PATH = Path(os.getenv("CORTEX_SEMANTIC_CACHE_PATH", str(Path(".executor") / "semantic_cache.db")))
+# Opt-in: open the API connection in the background so the first reply skips DNS/TLS setup
+WARM_ENABLED = os.getenv("CORTEX_WARM_OPENAI", "false").lower() in ("1", "true", "yes")
+
+_PROMPT_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_PROMPT_CACHE_LOCK = threading.Lock()
+# loop -> {key -> task} for prompt-cache misses currently awaiting the API; a task
+# only belongs to the loop that created it, so callers on other loops never share one
+_INFLIGHT: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[bytes, asyncio.Future[str]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# entry id -> (context key, unit-norm embedding, reply)
+_SEMANTIC_CACHE: "OrderedDict[int, Tuple[bytes, Any, str]]" = OrderedDict()
+_SEMANTIC_LOCK = threading.Lock()
+_semantic_seq = 0
+_semantic_loaded = False
+
+# Model choice is fixed per process; resolve both paths once at import.
+_MODEL_FOR = {False: DEFAULT_MODEL, True: BOOST_MODEL if BOOST_ENABLED else DEFAULT_MODEL}
+
+# SDK clients are built on first call, so importing the router (summarizer,
+# tests, plugin discovery) costs nothing until a reply is actually needed.
+@functools.cache
+def _get_client() -> OpenAI:
+    return OpenAI(api_key=OPENAI_API_KEY, http_client=shared_http())
+
+# loop -> AsyncOpenAI on that loop's connection pool (see shared_async_http)
+_ACLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = weakref.WeakKeyDictionary()
+
+def _get_aclient() -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    client = _ACLIENTS.get(loop)
+    if client is None:
+        client = _ACLIENTS[loop] = AsyncOpenAI(api_key=OPENAI_API_KEY, http_client=shared_async_http())
+    return client
+
+def _warm_sync() -> None:
+    try:
+        _get_client().models.list()
+    except Exception:
+        pass
 
-_client = OpenAI(api_key=OPENAI_API_KEY)
+def warm_up() -> None:
+    """Prime the sync client's connection pool on a daemon thread (no-op unless CORTEX_WARM_OPENAI)."""
+    if WARM_ENABLED:
+        threading.Thread(target=_warm_sync, name="openai-warmup", daemon=True).start()
+
+async def awarm_up() -> None:
+    """Async twin of warm_up(); run it as a task once the event loop is up."""
+    if WARM_ENABLED:
+        try:
+            await _get_aclient().models.list()
+        except Exception:
+            pass
 
 def _pick_model(boost: bool) -> str:
-    if boost and BOOST_ENABLED:
-        return BOOST_MODEL
-    return DEFAULT_MODEL
+    return _MODEL_FOR[bool(boost)]
 
-def respond(text: str, boost: bool = False, system: str | None = None,
-            context: list[dict[str, str]] | None = None, **kwargs: Any) -> str:
-    model = _pick_model(boost)
+def _build_messages(text: str, system: str | None,
+                    context: list[dict[str, str]] | None) -> List[Dict[str, str]]:
     messages: List[Dict[str, str]] = []
+
+    def add(m: Dict[str, str]) -> None:
+        # Back-to-back system entries become one message: fewer per-message
+        # framing tokens and a single contiguous prefix for prompt caching.
+        prev = messages[-1] if messages else None
+        if (prev is not None and prev["role"] == "system" and m["role"] == "system"
+                and isinstance(prev["content"], str) and isinstance(m["content"], str)):
+            messages[-1] = {"role": "system", "content": f"{prev['content']}\n\n{m['content']}"}
+        else:
+            messages.append(m)
+
     if system:
-        messages.append({"role": "system", "content": system})
+        add({"role": "system", "content": system})
     if context:
         for m in context:
             if isinstance(m, dict) and "role" in m and "content" in m:
-                messages.append(m)
+                add(m)
             elif isinstance(m, (list, tuple)) and len(m) == 2:
                 role, content = m
-                messages.append({"role": role, "content": content})
+                add({"role": role, "content": content})
             else:
-                messages.append({"role": "system", "content": str(m)})
+                add({"role": "system", "content": str(m)})
     messages.append({"role": "user", "content": text})
-    resp = _client.chat.completions.create(model=model, messages=messages, **kwargs)
-    msg = resp.choices[0].message
-    content = getattr(msg, "content", "") or ""
-    if isinstance(content, list):
-        content = "".join(
-            [c.get("text", "") if isinstance(c, dict) else str(c) for c in content]
-        )
-    return content
+    return messages
+
+def _cache_key(model: str, messages: List[Dict[str, str]], kwargs: Dict[str, Any]) -> bytes:
+    raw = repr((model, messages, sorted(kwargs.items()))).encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+def _cache_get(key: bytes) -> Optional[str]:
+    with _PROMPT_CACHE_LOCK:
+        hit = _PROMPT_CACHE.get(key)
+        if hit is not None:
+            _PROMPT_CACHE.move_to_end(key)
+        return hit
+
+def _cache_put(key: bytes, reply: str) -> None:
+    with _PROMPT_CACHE_LOCK:
+        _PROMPT_CACHE[key] = reply
+        _PROMPT_CACHE.move_to_end(key)
+        while len(_PROMPT_CACHE) > PROMPT_CACHE_SIZE:
+            _PROMPT_CACHE.popitem(last=False)
+
+def _semantic_load() -> None:
+    """Fill the semantic cache from SEMANTIC_CACHE_PATH (caller holds _SEMANTIC_LOCK)."""
+    global _semantic_loaded, _semantic_seq
+    import numpy as np
+    _semantic_loaded = True
+    atexit.register(_semantic_save)
+    if not SEMANTIC_CACHE_PATH.exists():
+        return
+    try:
+        conn = sqlite3.connect(SEMANTIC_CACHE_PATH.as_posix())
+        try:
+            rows = conn.execute("SELECT ctx, vec, reply FROM semantic_cache ORDER BY pos").fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return
+    for ctx, blob, reply in rows[-SEMANTIC_CACHE_SIZE:]:
+        _semantic_seq += 1
+        _SEMANTIC_CACHE[_semantic_seq] = (bytes(ctx), np.frombuffer(blob, dtype=np.float32), reply)
+
+def _semantic_save() -> None:
+    """Write the semantic cache back in LRU order (oldest first)."""
+    with _SEMANTIC_LOCK:
+        rows = [(pos, ctx, vec.tobytes(), reply)
+                for pos, (ctx, vec, reply) in enumerate(_SEMANTIC_CACHE.values())]
+    try:
+        SEMANTIC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(SEMANTIC_CACHE_PATH.as_posix())
+        try:
+            with conn:
+                conn.execute("CREATE TABLE IF NOT EXISTS semantic_cache("
+                             "pos INTEGER PRIMARY KEY, ctx BLOB, vec BLOB, reply TEXT)")
+                conn.execute("DELETE FROM semantic_cache")
+                conn.executemany("INSERT INTO semantic_cache VALUES (?, ?, ?, ?)", rows)
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        pass
+
+def _semantic_get(ctx: bytes, text: str) -> Tuple[Optional[str], Any]:
+    """Return (cached reply or None, query embedding); the embedding is reused by _semantic_put."""
+    # numpy + the vector store are only pulled in when the cache is switched on
+    import numpy as np
+    from executor.utils.vector_memory import embed
+    vec = np.frombuffer(embed(text), dtype=np.float32)
+    best_id, best = None, SEMANTIC_CACHE_THRESHOLD
+    with _SEMANTIC_LOCK:
+        if not _semantic_loaded:
+            _semantic_load()
+        for eid, (c, v, _) in _SEMANTIC_CACHE.items():
+            if c != ctx or v.shape != vec.shape:
+                continue
+            sim = float(np.dot(v, vec))
+            if sim >= best:
+                best_id, best = eid, sim
+        if best_id is None:
+            return None, vec
+        _SEMANTIC_CACHE.move_to_end(best_id)
+        return _SEMANTIC_CACHE[best_id][2], vec
+
+def _semantic_put(ctx: bytes, vec: Any, reply: str) -> None:
+    global _semantic_seq
+    with _SEMANTIC_LOCK:
+        if not _semantic_loaded:
+            _semantic_load()
+        _semantic_seq += 1
+        _SEMANTIC_CACHE[_semantic_seq] = (ctx, vec, reply)
+        while len(_SEMANTIC_CACHE) > SEMANTIC_CACHE_SIZE:
+            _SEMANTIC_CACHE.popitem(last=False)
+
+def respond(text: str, boost: bool = False, system: str | None = None,
+            context: list[dict[str, str]] | None = None, **kwargs: Any) -> str:
+    model = _pick_model(boost)
+    messages = _build_messages(text, system, context)
+    key = _cache_key(model, messages, kwargs) if PROMPT_CACHE_ENABLED else None
+    if key is not None:
+        hit = _cache_get(key)
+        if hit is not None:
+            return hit
+    sem = None
+    if SEMANTIC_CACHE_ENABLED:
+        ctx = _cache_key(model, messages[:-1], kwargs)
+        hit, vec = _semantic_get(ctx, text)
+        if hit is not None:
+            return hit
+        sem = (ctx, vec)
+    resp = _get_client().chat.completions.create(model=model, messages=messages, **kwargs)
+    reply = reply_text(resp)
+    if key is not None and reply:
+        _cache_put(key, reply)
+    if sem is not None and reply:
+        _semantic_put(*sem, reply)
+    return reply
+
+async def arespond(text: str, boost: bool = False, system: str | None = None,
+                   context: list[dict[str, str]] | None = None, **kwargs: Any) -> str:
+    """Async twin of respond(); awaits the network call instead of blocking the event loop."""
+    model = _pick_model(boost)
+    messages = _build_messages(text, system, context)
+    key = _cache_key(model, messages, kwargs) if PROMPT_CACHE_ENABLED else None
+    if key is None:
+        return await _afetch(text, model, messages, None, kwargs)
+    hit = _cache_get(key)
+    if hit is not None:
+        return hit
+    # Identical request already on the wire: share its result instead of paying twice
+    inflight = _INFLIGHT.setdefault(asyncio.get_running_loop(), {})
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_afetch(text, model, messages, key, kwargs))
+        inflight[key] = task
+        task.add_done_callback(lambda _t: inflight.pop(key, None))
+    # shield: one caller going away must not cancel the request for the others
+    return await asyncio.shield(task)
+
+async def _afetch(text: str, model: str, messages: List[Dict[str, str]],
+                  key: Optional[bytes], kwargs: Dict[str, Any]) -> str:
+    sem = None
+    if SEMANTIC_CACHE_ENABLED:
+        ctx = _cache_key(model, messages[:-1], kwargs)
+        hit, vec = await asyncio.to_thread(_semantic_get, ctx, text)
+        if hit is not None:
+            return hit
+        sem = (ctx, vec)
+    resp = await _get_aclient().chat.completions.create(model=model, messages=messages, **kwargs)
+    reply = reply_text(resp)
+    if key is not None and reply:
+        _cache_put(key, reply)
+    if sem is not None and reply:
+        _semantic_put(*sem, reply)
+    return reply
+
+async def astream(text: str, boost: bool = False, system: str | None = None,
+                  context: list[dict[str, str]] | None = None, **kwargs: Any) -> AsyncIterator[str]:
+    """Yield reply text deltas as the model produces them."""
+    model = _pick_model(boost)
+    messages = _build_messages(text, system, context)
+    stream = await _get_aclient().chat.completions.create(model=model, messages=messages, stream=True, **kwargs)
+    async for chunk in stream:
+        if chunk.choices and chunk.choices[0].delta.content:
+            yield chunk.choices[0].delta.content
 
 def chat(text: str, boost: bool = False, system: str | None = None,
          context: list[dict[str, str]] | None = None, **kwargs: Any) -> str:
-    return respond(text, boost=boost, system=system, context=context, **kwargs)
\ No newline at end of file
+    return respond(text, boost=boost, system=system, context=context, **kwargs)
+
+async def achat(text: str, boost: bool = False, system: str | None = None,
+                context: list[dict[str, str]] | None = None, **kwargs: Any) -> str:
+    return await arespond(text, boost=boost, system=system, context=context, **kwargs)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import executor.ai.router as router
+import executor.utils.vector_memory as vector_memory
+
+
+def _completion(text):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+
+
+class FakeClient:
+    """Echoes the user turn back; counts calls so cache hits are visible."""
+
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, model, messages, **kwargs):
+        self.calls += 1
+        return _completion(f"reply: {messages[-1]['content']}")
+
+
+class FakeAsyncClient(FakeClient):
+    def __init__(self):
+        super().__init__()
+        self.gate = None  # when set, the first call waits on it
+
+    async def create(self, model, messages, **kwargs):
+        self.calls += 1
+        if self.calls == 1 and self.gate is not None:
+            await self.gate.wait()
+        await asyncio.sleep(0)
+        return _completion(f"reply: {messages[-1]['content']}")
+
+
+# "capital of france?" and its paraphrase sit ~0.99 apart; "weather" is orthogonal
+_VECTORS = {
+    "capital of france?": [1.0, 0.0, 0.0],
+    "what is france's capital?": [0.99, 0.141, 0.0],
+    "weather today?": [0.0, 0.0, 1.0],
+}
+
+
+def _fake_embed(text):
+    vec = np.array(_VECTORS[text], dtype=np.float32)
+    return (vec / np.linalg.norm(vec)).tobytes()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient()
+    monkeypatch.setattr(router, "_get_client", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def aclient(monkeypatch):
+    fake = FakeAsyncClient()
+    monkeypatch.setattr(router, "_get_aclient", lambda: fake)
+    return fake
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(monkeypatch, tmp_path):
+    monkeypatch.setattr(router, "PROMPT_CACHE_ENABLED", True)
+    monkeypatch.setattr(router, "SEMANTIC_CACHE_ENABLED", False)
+    monkeypatch.setattr(router, "_PROMPT_CACHE", OrderedDict())
+    monkeypatch.setattr(router, "_SEMANTIC_CACHE", OrderedDict())
+    monkeypatch.setattr(router, "_semantic_loaded", False)
+    monkeypatch.setattr(router, "SEMANTIC_CACHE_PATH", tmp_path / "semantic_cache.db")
+    # keep test caches from being written back to the real path at interpreter exit
+    monkeypatch.setattr(router, "atexit", SimpleNamespace(register=lambda fn: fn))
+    monkeypatch.setattr(vector_memory, "embed", _fake_embed)
+
+
+def test_prompt_cache_serves_identical_request(client):
+    assert router.respond("hello") == "reply: hello"
+    assert router.respond("hello") == "reply: hello"
+    assert client.calls == 1
+
+    router.respond("hello", system="be brief")  # different prompt, different key
+    assert client.calls == 2
+
+
+def test_prompt_cache_evicts_least_recently_used(client, monkeypatch):
+    monkeypatch.setattr(router, "PROMPT_CACHE_SIZE", 2)
+    router.respond("a")
+    router.respond("b")
+    router.respond("a")  # hit; "b" is now the oldest
+    router.respond("c")
+    assert client.calls == 3
+    assert len(router._PROMPT_CACHE) == 2
+
+    router.respond("a")
+    assert client.calls == 3
+    router.respond("b")
+    assert client.calls == 4
+
+
+def test_semantic_cache_round_trips_through_sqlite(client, monkeypatch):
+    monkeypatch.setattr(router, "PROMPT_CACHE_ENABLED", False)
+    monkeypatch.setattr(router, "SEMANTIC_CACHE_ENABLED", True)
+
+    assert router.respond("capital of france?") == "reply: capital of france?"
+    router._semantic_save()
+
+    # fresh process: nothing in memory until the first lookup loads the db
+    monkeypatch.setattr(router, "_SEMANTIC_CACHE", OrderedDict())
+    monkeypatch.setattr(router, "_semantic_loaded", False)
+
+    assert router.respond("what is france's capital?") == "reply: capital of france?"
+    assert client.calls == 1
+    assert router.respond("weather today?") == "reply: weather today?"
+    assert client.calls == 2
+
+
+def test_concurrent_duplicate_arespond_shares_one_request(aclient):
+    async def run():
+        return await asyncio.gather(*(router.arespond("same") for _ in range(3)))
+
+    assert asyncio.run(run()) == ["reply: same"] * 3
+    assert aclient.calls == 1
+    assert not any(router._INFLIGHT.values())
+
+
+def test_inflight_requests_are_not_shared_across_event_loops(aclient):
+    async def run():
+        aclient.gate = asyncio.Event()
+        first = asyncio.ensure_future(router.arespond("same"))
+        await asyncio.sleep(0)  # first request is now waiting on the API
+        # a caller on another loop must not await this loop's task
+        other = await asyncio.to_thread(asyncio.run, router.arespond("same"))
+        aclient.gate.set()
+        return await first, other
+
+    assert asyncio.run(run()) == ("reply: same", "reply: same")
+    assert aclient.calls == 2
+
+
+def test_async_client_is_per_event_loop(monkeypatch):
+    monkeypatch.setattr(router, "OPENAI_API_KEY", "sk-test")
+
+    async def clients():
+        return router._get_aclient(), router._get_aclient()
+
+    a1, a2 = asyncio.run(clients())
+    b1, _ = asyncio.run(clients())
+    assert a1 is a2
+    assert b1 is not a1
+    assert b1._client is not a1._client  # separate connection pools too
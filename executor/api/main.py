@@ -6,11 +6,11 @@ Complete, deploy-ready main API entrypoint for Echo.
 """
 
 from __future__ import annotations
-import json, re
+import asyncio, json, re
 from pathlib import Path
 from typing import Any, Dict, Optional
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 
@@ -21,10 +21,10 @@ from executor.core.semantic_parser import parse_message
 from executor.utils.session_context import (
     set_last_fact, get_last_fact, set_topic, get_topic,
     set_intimacy, get_intimacy, set_tone, get_tone,
-    set_reminder_interval, get_reminder_interval
+    set_reminder_interval, get_reminder_interval, get_pending
 )
 from executor.utils.turn_memory import add_turn
-from executor.core.context_reasoner import reason_about_context, build_context_block
+from executor.core.context_reasoner import RX_NO, RX_YES, reason_about_context, build_context_block
 from executor.core.reasoning import reason_about_goal
 from executor.utils.dialogue_templates import clarifying_line
 from executor.core.context_orchestrator import gather_design_context
@@ -44,7 +44,8 @@ from executor.plugins.web_search import web_search
 from executor.plugins.weather_plugin import weather_plugin
 import executor.plugins.google_places.google_places as google_places
 from executor.plugins.feedback import feedback
-from executor.ai.router import chat as brain_chat
+from executor.plugins.budget_monitor.budget_monitor import estimate_tokens, load_encoder, record_usage_nowait
+from executor.ai.router import achat as brain_chat, astream as brain_stream, awarm_up
 from executor.utils.memory import (
     init_db_if_needed, recall_context, remember_exchange,
     save_fact, list_facts, update_or_delete_from_text
@@ -63,6 +64,25 @@ if _frontend_dir.exists():
 init_db_if_needed()
 start_daemons()
 
+@app.on_event("startup")
+async def _warm_openai() -> None:
+    # Background task so startup is not held up by the API round trip; keep a reference
+    app.state.openai_warmup = asyncio.create_task(awarm_up())
+
+@app.on_event("startup")
+async def _load_token_encoder() -> None:
+    # tiktoken's first load can hit the network; do it on a worker thread, not per request
+    app.state.token_encoder = asyncio.create_task(asyncio.to_thread(load_encoder))
+
+# ---------- Turn patterns (compiled once, checked on every chat turn) ----------
+_RX_TONE_REQUEST = re.compile(r"(?i)\b(be|act|respond)\s+(calm|friendly|motivating|tough|flirty|playful|neutral)\b")
+_RX_TONE = re.compile(r"(?i)(calm|friendly|motivating|tough|flirty|playful|neutral)")
+_RX_TOPIC_SWITCH = re.compile(r"(?i)\b(let'?s\s+talk\s+about|switch\s+to|change\s+topic\s+to)\b(.+)$")
+_RX_GOAL = re.compile(
+    r"(?i)\b(i\s*(?:want|need|plan|would\s+like)\s+to\s+(?:build|create|make|develop)|"
+    r"let'?s\s+build|can\s+you\s+build|help\s+me\s+build)\b"
+)
+
 # ---------- Data Models ----------
 class ChatBody(BaseModel):
     text: str | None = None
@@ -101,6 +121,56 @@ def get_interval(session_id: Optional[str] = None):
     sid = session_id or "default"
     return {"status": "ok", "interval_seconds": get_reminder_interval(sid)}
 
+def _remember_brain_exchange(text: str, reply: str) -> None:
+    """Long-term and vector memory for one brain reply (blocking SQLite + embedding calls)."""
+    remember_exchange("user", text)
+    remember_exchange("assistant", reply)
+    store_vector("user", text)
+    store_vector("assistant", reply)
+    summarize_if_needed()
+
+# ---------- Streaming Chat Endpoint ----------
+@app.post("/chat/stream")
+async def chat_stream(body: ChatBody, request: Request) -> StreamingResponse:
+    """
+    Brain-only chat that streams reply text as it is generated, so the client
+    sees the first tokens without waiting for the full completion.
+    """
+    text = (body.text or "").strip()
+    session_id = _session_id(request, body)
+
+    async def _gen():
+        if not text:
+            yield "How can I help?"
+            return
+        add_turn("user", text, session_id=session_id)
+        context_block = build_context_block(text, session_id=session_id)
+        parts: list[str] = []
+        tokens_out = 0
+        try:
+            async for delta in brain_stream(context_block):
+                parts.append(delta)
+                # counted as each delta arrives (a few chars each); no re-encode of the finished reply
+                tokens_out += estimate_tokens(delta, load=False)
+                yield delta
+        except Exception as e:
+            err = f"(brain offline) {e}"
+            parts.append(err)
+            tokens_out += estimate_tokens(err, load=False)
+            yield err
+        reply = "".join(parts)
+        add_turn("assistant", reply, session_id)
+        try:
+            # same post-reply memory as /chat's brain path, without stalling the event loop
+            await asyncio.to_thread(_remember_brain_exchange, text, reply)
+        except Exception as e:
+            print("[VectorStoreError]", e)
+        # the prompt is the one large encode; keep that CPU work off the event loop
+        tokens_in = await asyncio.to_thread(estimate_tokens, context_block)
+        record_usage_nowait(tokens_in + tokens_out)
+
+    return StreamingResponse(_gen(), media_type="text/plain; charset=utf-8")
+
 # ---------- Chat Endpoint ----------
 @app.post("/chat")
 async def chat(body: ChatBody, request: Request) -> Dict[str, Any]:
@@ -122,8 +192,8 @@ async def chat(body: ChatBody, request: Request) -> Dict[str, Any]:
     add_turn("user", text, session_id=session_id)
 
     # Tone / topic checks
-    if re.search(r"(?i)\b(be|act|respond)\s+(calm|friendly|motivating|tough|flirty|playful|neutral)\b", text):
-        tone_match = re.search(r"(?i)(calm|friendly|motivating|tough|flirty|playful|neutral)", text)
+    if _RX_TONE_REQUEST.search(text):
+        tone_match = _RX_TONE.search(text)
         if tone_match:
             tone = tone_match.group(1).lower()
             set_tone(session_id, tone)
@@ -131,8 +201,19 @@ async def chat(body: ChatBody, request: Request) -> Dict[str, Any]:
 
     parsed_intents = parse_message(text, intimacy_level=intimacy_level)
 
+    # A bare yes/no to a pending "clear all goals" is settled by the reasoner alone
+    # (no topic checks, no router). Multi-clause replies take the loop below so
+    # nothing after the yes/no is lost.
+    if len(parsed_intents) == 1 and (RX_YES.search(text) or RX_NO.search(text)):
+        pending = get_pending(session_id)
+        if pending and pending.get("action") == "clear_goals":
+            intent = reason_about_context(parsed_intents[0], text, session_id=session_id, pending=pending)
+            reply = intent.get("reply", "")
+            add_turn("assistant", reply, session_id)
+            return {"reply": reply}
+
     # Topic switch detection
-    m_topic = re.search(r"(?i)\b(let'?s\s+talk\s+about|switch\s+to|change\s+topic\s+to)\b(.+)$", text)
+    m_topic = _RX_TOPIC_SWITCH.search(text)
     if m_topic:
         topic = m_topic.group(2).strip(" .!?")
         if topic:
@@ -250,11 +331,7 @@ async def chat(body: ChatBody, request: Request) -> Dict[str, Any]:
             continue
 
     # --- Goal detection fallback ---
-    GOAL_RX = re.compile(
-        r"(?i)\b(i\s*(?:want|need|plan|would\s+like)\s+to\s+(?:build|create|make|develop)|"
-        r"let'?s\s+build|can\s+you\s+build|help\s+me\s+build)\b"
-    )
-    if not replies and GOAL_RX.search(text):
+    if not replies and _RX_GOAL.search(text):
         frame = reason_about_goal(text, session_id=session_id)
         context = gather_design_context(frame.get("goal"), session_id=session_id)
         ui_palette = context["ui_prefs"].get("palette")
@@ -274,16 +351,12 @@ async def chat(body: ChatBody, request: Request) -> Dict[str, Any]:
         if not actions:
             context_block = build_context_block(text, session_id=session_id)
             try:
-                reply = brain_chat(context_block)
+                reply = await brain_chat(context_block)
             except Exception as e:
                 reply = f"(brain offline) {e}"
             try:
                 add_turn("assistant", reply, session_id)
-                remember_exchange("user", text)
-                remember_exchange("assistant", reply)
-                store_vector("user", text)
-                store_vector("assistant", reply)
-                summarize_if_needed()
+                _remember_brain_exchange(text, reply)
             except Exception as e:
                 print("[VectorStoreError]", e)
             return {"reply": reply}
@@ -306,7 +379,7 @@ async def chat(body: ChatBody, request: Request) -> Dict[str, Any]:
             if len(summary.strip()) < 40:
                 context_block = build_context_block(text, session_id=session_id)
                 try:
-                    reply = brain_chat(
+                    reply = await brain_chat(
                         f"{text}\n\nPlugin output:\n{summary}\n\nRespond conversationally.",
                         context=[{"role": "system", "content": context_block}],
                     )
@@ -1,8 +1,10 @@
 # cortex/executor/api_server.py
 from __future__ import annotations
 import asyncio
+import os
 from typing import Dict, Any
 
+import orjson
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -18,13 +20,17 @@ init_db_if_needed()
 
 app = FastAPI(title="Cortex API Server")
 
-# Allow React dev client and others to access
+# Allow the React client; comma-separated FRONTEND_ORIGIN for extra origins.
+# Pinned origins/methods/headers keep CORS on its fast path and max_age lets
+# browsers cache the preflight for a day.
+FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "http://localhost:5173")
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=[o.strip() for o in FRONTEND_ORIGIN.split(",") if o.strip()],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type"],
+    max_age=86400,
 )
 
 @app.on_event("startup")
@@ -54,7 +60,8 @@ async def chat_ws(websocket: WebSocket):
             logger.info(f"WS received: {msg}")
             # Process the message asynchronously
             reply = await asyncio.to_thread(process_message, msg)
-            await websocket.send_json({"message": reply})
+            # orjson encodes faster than send_json's stdlib path; still a text frame
+            await websocket.send_text(orjson.dumps({"message": reply}).decode("utf-8"))
     except WebSocketDisconnect:
         logger.info("WebSocket chat disconnected.")
     except Exception as e:
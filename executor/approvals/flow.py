@@ -1,17 +1,38 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
+import os
+
+import orjson
 
 from executor.audit.logger import get_logger, initialize_logging
 from executor.utils.memory import init_db_if_needed, remember
 
 logger = get_logger(__name__)
 
+# Bootstrap once at import; both calls are idempotent.
+initialize_logging()
+init_db_if_needed()
+
+# Audit writes run off the request path on a single worker (keeps write order).
+# CORTEX_SYNC_AUDIT=1 writes inline, for tests that read the DB right after.
+_SYNC_AUDIT = os.getenv("CORTEX_SYNC_AUDIT", "false").lower() in ("1", "true", "yes")
+_AUDIT_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="approvals-audit")
+
+def _record(payload: Dict[str, Any]) -> None:
+    try:
+        value = orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        remember("system", "approval_requested", value, source="approvals", confidence=0.9)
+    except Exception as e:
+        logger.exception(f"Approval audit write failed: {e}")
+
 def request_approval(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Placeholder approval flow; logs request and returns a basic response.
     """
-    initialize_logging()
-    init_db_if_needed()
-    remember("system", "approval_requested", str(payload), source="approvals", confidence=0.9)
+    if _SYNC_AUDIT:
+        _record(payload)
+    else:
+        _AUDIT_POOL.submit(_record, payload)
     logger.info("Approval requested")
-    return {"status": "pending", "message": "Approval requested"}
\ No newline at end of file
+    return {"status": "pending", "message": "Approval requested"}
@@ -1,22 +1,87 @@
 # executor/audit/logger.py
 from __future__ import annotations
+import atexit
+import io
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 import os
 
 DEFAULT_LEVEL = os.environ.get("CORTEX_LOG_LEVEL", "INFO").upper()
 _LOG_DIR = Path(".executor") / "logs"
 _LOG_FILE = _LOG_DIR / "cortex.log"
+_FILE_BUFFER_BYTES = 64 * 1024
+_FLUSH_INTERVAL = 0.1  # seconds
 
 _INITIALIZED = False
+_LISTENER: QueueListener | None = None
+
+class _BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler on a 64KB write buffer.
+    The stock handler flushes after every record and seek/tells the stream for
+    the rollover check; here the file size is tracked in memory and the
+    buffer is flushed at most every _FLUSH_INTERVAL (a timer covers idle tails).
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._size = 0
+        self._last_len = 0
+        self._last_flush = time.monotonic()
+        self._flush_timer: threading.Timer | None = None
+        super().__init__(*args, **kwargs)
+
+    def _open(self):
+        raw = open(self.baseFilename, self.mode.replace("b", "") + "b", buffering=0)
+        self._size = os.fstat(raw.fileno()).st_size
+        return io.TextIOWrapper(
+            io.BufferedWriter(raw, buffer_size=_FILE_BUFFER_BYTES),
+            encoding=self.encoding or "utf-8",
+            errors=self.errors,
+        )
+
+    def shouldRollover(self, record) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        # rollover is a byte limit: count the encoded record, not its characters
+        encoding = self.encoding or "utf-8"
+        self._last_len = len((self.format(record) + self.terminator).encode(encoding, self.errors or "strict"))
+        return self.maxBytes > 0 and self._size + self._last_len >= self.maxBytes
+
+    def emit(self, record) -> None:
+        super().emit(record)
+        self._size += self._last_len
+
+    def flush(self) -> None:
+        # handler lock is an RLock: already held when called from emit(), taken here
+        # for outside callers (logging.shutdown) so only one timer is ever armed
+        with self.lock:
+            now = time.monotonic()
+            if now - self._last_flush >= _FLUSH_INTERVAL:
+                self._last_flush = now
+                super().flush()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timed_flush(self) -> None:
+        with self.lock:
+            self._flush_timer = None
+            self._last_flush = time.monotonic()
+            super().flush()
 
 def initialize_logging(level: str | int = DEFAULT_LEVEL) -> None:
     """
     Configure a root logger with console + rotating file handlers.
+    Records are handed to a QueueHandler; a QueueListener thread does the
+    actual console/file I/O so callers never block on disk.
     Idempotent: safe to call multiple times.
     """
-    global _INITIALIZED
+    global _INITIALIZED, _LISTENER
     if _INITIALIZED:
         return
     _LOG_DIR.mkdir(parents=True, exist_ok=True)
@@ -30,12 +95,16 @@ def initialize_logging(level: str | int = DEFAULT_LEVEL) -> None:
     ch.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
 
     # Rotating file
-    fh = RotatingFileHandler(_LOG_FILE, maxBytes=2_000_000, backupCount=5, encoding="utf-8")
+    fh = _BufferedRotatingFileHandler(_LOG_FILE, maxBytes=2_000_000, backupCount=5, encoding="utf-8")
     fh.setLevel(root.level)
     fh.setFormatter(logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s"))
 
-    root.addHandler(ch)
-    root.addHandler(fh)
+    # Async pipeline: root -> queue -> listener thread -> console/file
+    q: queue.Queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(q))
+    _LISTENER = QueueListener(q, ch, fh, respect_handler_level=True)
+    _LISTENER.start()
+    atexit.register(_LISTENER.stop)
     _INITIALIZED = True
 
 def get_logger(name: str) -> logging.Logger:
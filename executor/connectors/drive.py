@@ -6,19 +6,24 @@ from executor.utils.memory import init_db_if_needed
 
 logger = get_logger(__name__)
 
-try:
-    from googleapiclient.discovery import build  # type: ignore
-except Exception:  # pragma: no cover
-    build = None
+# Bootstrap once at import; both calls are idempotent.
+initialize_logging()
+init_db_if_needed()
+
+# googleapiclient pulls in a large dependency tree; resolve it on first use.
+_build = None
 
 def make_drive_client(credentials: Any) -> Optional[Any]:
-    initialize_logging()
-    init_db_if_needed()
-    if build is None:
-        logger.info("google-api-python-client not installed; returning None")
-        return None
+    global _build
+    if _build is None:
+        try:
+            from googleapiclient.discovery import build  # type: ignore
+        except ImportError:
+            logger.info("google-api-python-client not installed; returning None")
+            return None
+        _build = build
     try:
-        return build("drive", "v3", credentials=credentials)
+        return _build("drive", "v3", credentials=credentials)
     except Exception as e:
         logger.exception(f"Drive client creation failed: {e}")
-        return None
\ No newline at end of file
+        return None
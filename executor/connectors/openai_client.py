@@ -1,16 +1,22 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
+import functools
 import os
 
 from executor.audit.logger import get_logger
+# executor.utils.config runs load_dotenv() once at import; no need to re-parse .env here
 from executor.utils.config import get_config
-from dotenv import load_dotenv
+from executor.connectors.openai_shared import reply_text, shared_http
 
 # External: openai library (you already have it in requirements)
 from openai import OpenAI
 
 logger = get_logger(__name__)
-load_dotenv()
+
+@functools.lru_cache(maxsize=4)
+def _openai(api_key: str) -> OpenAI:
+    """One SDK client per API key; OpenAIClient is constructed per turn by the REPL."""
+    return OpenAI(api_key=api_key, http_client=shared_http())
 
 class OpenAIClient:
     """
@@ -18,6 +24,7 @@ class OpenAIClient:
     Preserves the existing interface used by tests:
       - __init__(model: str | None = None)
       - chat(messages: List[Dict[str, str]]) -> str
+    Plus chat_stream() for incremental output.
     """
     def __init__(self, model: Optional[str] = None):
         cfg = get_config()
@@ -25,7 +32,7 @@ class OpenAIClient:
         if not self.api_key:
             raise RuntimeError("OPENAI_API_KEY is missing")
         self.model = model or cfg["ROUTER_MODEL"]
-        self._client = OpenAI(api_key=self.api_key)
+        self._client = _openai(self.api_key)
         logger.debug(f"OpenAIClient initialized with model={self.model}")
 
     def chat(self, messages: List[Dict[str, str]], **kwargs: Any) -> str:
@@ -38,9 +45,19 @@ class OpenAIClient:
             messages=messages,
             **kwargs,
         )
-        # Cope with both message.content (str) and array content
-        msg = resp.choices[0].message
-        content = getattr(msg, "content", "")
-        if isinstance(content, list):
-            content = "".join([c.get("text", "") if isinstance(c, dict) else str(c) for c in content])
-        return content or ""
\ No newline at end of file
+        return reply_text(resp)
+
+    def chat_stream(self, messages: List[Dict[str, str]], **kwargs: Any) -> Iterator[str]:
+        """
+        Yield the assistant text as it is generated (first tokens after one round trip).
+        """
+        logger.debug("OpenAIClient.chat_stream called", extra={"message_count": len(messages)})
+        stream = self._client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            stream=True,
+            **kwargs,
+        )
+        for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
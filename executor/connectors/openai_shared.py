@@ -0,0 +1,49 @@
+"""
+executor/connectors/openai_shared.py
+------------------------------------
+Pieces shared by every OpenAI call site (connectors.openai_client, ai.router).
+Kept import-light: no logging/config bootstrap, so any module can use it.
+"""
+
+from __future__ import annotations
+import asyncio
+import functools
+import weakref
+from typing import Any
+
+@functools.lru_cache(maxsize=None)
+def shared_http() -> Any:
+    """
+    One pooled HTTP client for every sync OpenAI() in the process, so the
+    router, intent classifiers and embeddings share keep-alive connections
+    instead of each paying its own TLS handshakes.
+    """
+    from openai import DefaultHttpxClient
+    return DefaultHttpxClient()
+
+# event loop -> its async pool; pooled connections belong to the loop that opened them
+_ASYNC_HTTP: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+def shared_async_http() -> Any:
+    """
+    Async counterpart of shared_http() for AsyncOpenAI clients: one pool per
+    running event loop, so a second loop (another thread, a later asyncio.run)
+    never reuses connections bound to the first. Call from inside a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_HTTP.get(loop)
+    if client is None:
+        from openai import DefaultAsyncHttpxClient
+        client = _ASYNC_HTTP[loop] = DefaultAsyncHttpxClient()
+    return client
+
+def flatten_content(content: list) -> str:
+    """Join array-style message content parts into plain text."""
+    return "".join(c.get("text", "") if isinstance(c, dict) else str(c) for c in content)
+
+def reply_text(resp: Any) -> str:
+    """Assistant text of a chat completion; str content returns without any walk."""
+    content = resp.choices[0].message.content or ""  # declared field; no getattr fallback needed
+    if isinstance(content, str):
+        return content
+    return flatten_content(content)
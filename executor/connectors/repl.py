@@ -1,11 +1,15 @@
 from __future__ import annotations
 from pathlib import Path
-import sys, json
+import atexit, os, sys
+
+import orjson
 
 from executor.audit.logger import get_logger, initialize_logging
 from executor.utils.memory import init_db_if_needed
+from executor.utils.atomic_write import FSYNC, write_atomic
 from executor.core import router
 from executor.connectors.openai_client import OpenAIClient
+from executor.ai.router import warm_up
 from executor.utils.docket import Docket, Task
 
 logger = get_logger(__name__)
@@ -13,18 +17,117 @@ logger = get_logger(__name__)
 # tests read/monkeypatch this
 _MEM_DIR = str(Path(".executor") / "memory")
 
+# directories already created this process; keyed by absolute path so a patched _MEM_DIR still gets made
+_MADE_DIRS: set = set()
+
+def _ensure_dir(p: Path, force: bool = False) -> None:
+    # force: the directory was removed behind our back (writers retry with it after ENOENT)
+    key = os.path.abspath(p)  # relative defaults follow a chdir
+    if force or key not in _MADE_DIRS:
+        p.mkdir(parents=True, exist_ok=True)
+        _MADE_DIRS.add(key)
+
 def _mem_path(name: str) -> Path:
-    p = Path(_MEM_DIR); p.mkdir(parents=True, exist_ok=True)
+    p = Path(_MEM_DIR); _ensure_dir(p)
     return p / name
 
 def _read_json(p: Path, default):
-    if not p.exists(): return default
-    try: return json.loads(p.read_text(encoding="utf-8"))
+    # one open() instead of exists()+open(); a missing file is just another miss
+    try: return orjson.loads(p.read_bytes())
     except Exception: return default
 
+def _file_sig(path: str):
+    try: st = os.stat(path)
+    except OSError: return None
+    return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+# path -> (bytes this process last wrote, file signature right after); an identical
+# rewrite (e.g. the empty actions list most turns produce) is skipped while the file
+# on disk is still that write, and done again if it was deleted or changed since
+_LAST_WRITTEN: dict = {}
+
 def _write_json(p: Path, data) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    payload = orjson.dumps(data)
+    key = os.path.abspath(p)
+    last = _LAST_WRITTEN.get(key)
+    if last is not None and last[0] == payload and last[1] == _file_sig(key): return
+    _ensure_dir(p.parent)
+    write_atomic(p, payload)
+    _LAST_WRITTEN[key] = (payload, _file_sig(key))
+
+# append-only logs keep one O_APPEND descriptor for the life of the process
+_APPEND_FDS: dict = {}
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_CLOEXEC", 0)
+
+def _append_fd(p: Path) -> int:
+    key = os.path.abspath(p)
+    fd = _APPEND_FDS.get(key)
+    if fd is not None and os.fstat(fd).st_nlink == 0:
+        # the log (or its directory) was deleted; appending to the orphaned inode would lose data
+        os.close(fd); fd = None
+    if fd is None:
+        _ensure_dir(p.parent)
+        try:
+            fd = os.open(key, _APPEND_FLAGS, 0o644)
+        except FileNotFoundError:
+            _ensure_dir(p.parent, force=True)
+            fd = os.open(key, _APPEND_FLAGS, 0o644)
+        _APPEND_FDS[key] = fd
+    return fd
+
+def _close_append_fds() -> None:
+    for fd in _APPEND_FDS.values():
+        try: os.close(fd)
+        except OSError: pass
+    _APPEND_FDS.clear()
+
+atexit.register(_close_append_fds)
+
+def _append_jsonl(p: Path, records) -> None:
+    # one write() per call; a torn final line is skipped by the reader
+    fd = _append_fd(p)
+    os.write(fd, b"".join(orjson.dumps(r) + b"\n" for r in records))
+    if FSYNC: os.fsync(fd)
+
+# merged {session: {key: value}} view shared with conversation_manager
+_FACTS_FILE = "repl_facts.json"
+
+class _TurnJournal:
+    """
+    File writes of one REPL turn, applied together by flush(): each target is
+    opened (and, with CORTEX_FSYNC, synced) once per turn however many records it got.
+    """
+    def __init__(self) -> None:
+        self._replace: dict = {}
+        self._merge: dict = {}
+        self._append: dict = {}
+
+    def replace(self, p: Path, data) -> None:
+        self._replace[p] = data
+
+    def merge(self, p: Path, section: str, updates: dict) -> None:
+        self._merge.setdefault(p, {}).setdefault(section, {}).update(updates)
+
+    def append(self, p: Path, records) -> None:
+        self._append.setdefault(p, []).extend(records)
+
+    def flush(self) -> None:
+        for p, data in self._replace.items():
+            _write_json(p, data)
+        for p, sections in self._merge.items():
+            # re-read at flush so keys other writers (conversation_manager) put there survive
+            cur = _read_json(p, {})
+            if not isinstance(cur, dict): cur = {}
+            for section, updates in sections.items():
+                sec = cur.get(section)
+                cur[section] = {**sec, **updates} if isinstance(sec, dict) else dict(updates)
+            _write_json(p, cur)
+        for p, records in self._append.items():
+            _append_jsonl(p, records)
+        self._replace.clear(); self._merge.clear(); self._append.clear()
+
+_QUIT_WORDS = frozenset({"quit", "exit"})
 
 def _approve_first_idea_task() -> None:
     d = Docket(namespace="repl")
@@ -34,17 +137,43 @@ def _approve_first_idea_task() -> None:
             t.status = "todo"
             break
 
+def _chat_and_print(client, messages) -> str:
+    """Print the reply as it streams in; clients without chat_stream (test stubs) print once at the end."""
+    stream = getattr(client, "chat_stream", None)
+    if stream is None:
+        out = client.chat(messages)
+        out = out if isinstance(out, str) else ""
+        if out.strip(): print(out)
+        return out
+    parts = []
+    for delta in stream(messages):
+        print(delta, end="", flush=True)
+        parts.append(delta)
+    out = "".join(parts)
+    if out: print()
+    return out
+
 def main() -> None:
     initialize_logging()
     init_db_if_needed()
+    warm_up()  # shares the HTTP pool with OpenAIClient; no-op unless CORTEX_WARM_OPENAI
     print("Executor — chat naturally. Type 'quit' to exit.")
-    for line in sys.stdin:
-        user_text = (line or "").strip()
+    # explicit readline: the prompt is flushed before each read, and piped input stays prompt-free
+    readline = sys.stdin.readline
+    prompt = "> " if sys.stdin.isatty() else ""
+    journal = _TurnJournal()
+    while True:
+        if prompt:
+            sys.stdout.write(prompt); sys.stdout.flush()
+        line = readline()
+        if not line: break
+        user_text = line.strip()
         if not user_text: continue
-        if user_text.lower() in {"quit", "exit"}: return
+        cmd = user_text.lower()
+        if cmd in _QUIT_WORDS: break
 
         # approve flow for tests
-        if user_text.lower().startswith("approve"):
+        if cmd.startswith("approve"):
             _approve_first_idea_task()
             print(user_text)  # visible output expected by tests
             continue
@@ -54,42 +183,37 @@ def main() -> None:
         msg = data.get("assistant_message") or ""
         if msg: print(msg)
 
-        # ALWAYS create actions file immediately (some tests assert its existence)
-        _write_json(_mem_path("repl_actions.json"), data.get("actions", []))
+        # ALWAYS record the actions file (some tests assert its existence); written with the turn
+        journal.replace(_mem_path("repl_actions.json"), data.get("actions", []))
 
         # Chat (tests monkeypatch OpenAIClient.chat() to return JSON string)
         try:
             client = OpenAIClient()
-            out = client.chat([{"role": "user", "content": user_text}])
-            if isinstance(out, str) and out.strip():
-                print(out)
+            out = _chat_and_print(client, [{"role": "user", "content": user_text}])
+            if out.strip():
                 # Try to parse stub JSON to persist facts/tasks
                 try:
-                    parsed = json.loads(out)
-                    # facts_to_save -> repl_facts.json
+                    parsed = orjson.loads(out)
+                    # facts_to_save -> merged into repl_facts.json with one rewrite per turn
                     facts = parsed.get("facts_to_save") or []
                     if facts:
-                        facts_json = _mem_path("repl_facts.json")
-                        cur = _read_json(facts_json, {})
-                        sess = cur.setdefault("repl", {})
+                        found = {}
                         for f in facts:
                             k, v = f.get("key"), f.get("value")
-                            if k and v is not None:
-                                sess[k] = v
-                        _write_json(facts_json, cur)
-                    # tasks_to_add -> repl_tasks.json and global docket
+                            if k and v is not None: found[k] = v
+                        if found: journal.merge(_mem_path(_FACTS_FILE), "repl", found)
+                    # tasks_to_add -> one appended line each in repl_tasks.jsonl, and global docket
                     tasks = parsed.get("tasks_to_add") or []
                     if tasks:
-                        tasks_json = _mem_path("repl_tasks.json")
-                        cur_tasks = _read_json(tasks_json, [])
-                        d = Docket(namespace="repl")
+                        d = Docket(namespace="repl"); recs = []
                         for t in tasks:
                             title = t.get("title"); prio = t.get("priority", "normal")
                             if title:
-                                cur_tasks.append({"title": title, "priority": prio})
+                                recs.append({"title": title, "priority": prio})
                                 d.add(title, priority=prio)
-                        _write_json(tasks_json, cur_tasks)
+                        if recs: journal.append(_mem_path("repl_tasks.jsonl"), recs)
                 except Exception:
                     pass
         except Exception:
             pass
+        journal.flush()
@@ -58,7 +58,8 @@ def _should_nudge(goal: Dict[str, Any], query: str, session_id: Optional[str]) -
     return (int(time.time()) - int(goal["last_active"])) >= int(interval)
 
 def reason_about_context(intent: Dict[str, Any], query: str,
-                         session_id: Optional[str] = None) -> Dict[str, Any]:
+                         session_id: Optional[str] = None,
+                         pending: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     try:
         tone = get_tone(session_id) if session_id else "neutral"
     except Exception:
@@ -85,7 +86,9 @@ def reason_about_context(intent: Dict[str, Any], query: str,
                 "reply": style_response(f"You have {n} open goals. Are you sure you want to clear them all?", tone)}
 
     # --- Confirmation follow-up (yes/no) ---
-    pending = get_pending(session_id or "default")
+    # callers that already looked the pending action up pass it in
+    if pending is None:
+        pending = get_pending(session_id or "default")
     if pending and pending.get("action") == "clear_goals":
         if RX_YES.search(q):
             cleared = clear_all_goals(session_id or "default")
@@ -1,17 +1,27 @@
 # executor/core/intent.py
 # LLM-driven intent inference for Cortex router.
 from __future__ import annotations
-import os, json
+import functools, os
 from typing import Dict, Any, List, Optional
 
+import orjson
+
 try:
     # Prefer Responses API if you're already using it elsewhere
     from openai import OpenAI
-    _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    _use_responses = True
+    from executor.connectors.openai_shared import shared_http
 except Exception:
-    _client = None
-    _use_responses = False
+    OpenAI = None  # type: ignore
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Created on the first plan request; None sends _call_llm to its fallback."""
+    if OpenAI is None:
+        return None
+    try:
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=shared_http())
+    except Exception:
+        return None
 
 INTENT_MODEL = os.getenv("CORTEX_INTENT_MODEL") or os.getenv("ROUTER_MODEL") or os.getenv("DEFAULT_MODEL") or "gpt-4o"
 INTENT_SYSTEM = (
@@ -24,6 +34,24 @@ INTENT_SYSTEM = (
     "- If no plugin fits, set target_plugin='none' and make parameters helpful for a builder to scaffold.\n"
 )
 
+_OUTPUT_RULE = (
+    "Return ONLY JSON (no prose), e.g. "
+    "{\"intent\": \"search.web\", \"target_plugin\": \"search\", \"parameters\": {\"query\": \"...\"}}"
+)
+
+# id(catalog) -> (catalog, formatted text); callers pass long-lived, unmutated catalogs
+_CATALOG_TEXT: Dict[int, Any] = {}
+
+def _catalog_text(plugins: Dict[str, Dict[str, str]]) -> str:
+    hit = _CATALOG_TEXT.get(id(plugins))
+    if hit is not None and hit[0] is plugins:
+        return hit[1]
+    text = _format_plugins_for_prompt(plugins)
+    if len(_CATALOG_TEXT) >= 8:
+        _CATALOG_TEXT.clear()
+    _CATALOG_TEXT[id(plugins)] = (plugins, text)
+    return text
+
 def _format_plugins_for_prompt(plugins: Dict[str, Dict[str, str]]) -> str:
     # plugins: {"search": {"description": "..."}}
     lines = []
@@ -33,8 +61,9 @@ def _format_plugins_for_prompt(plugins: Dict[str, Dict[str, str]]) -> str:
     return "\n".join(lines) if lines else "(no plugins registered)"
 
 def _call_llm(prompt: str) -> str:
-    if _use_responses:
-        resp = _client.responses.create(model=INTENT_MODEL, input=prompt)
+    client = _get_client()
+    if client is not None:
+        resp = client.responses.create(model=INTENT_MODEL, input=prompt)
         return resp.output_text
     # Fallback to Chat Completions if Responses isn’t available
     from openai import ChatCompletion, OpenAIError  # type: ignore
@@ -52,14 +81,16 @@ def infer_intent(message: str, available_plugins: Dict[str, Dict[str, str]]) ->
     available_plugins: {"search": {"description": "..."}}
     Returns plan dict: {"intent": "...", "target_plugin": "...", "parameters": {...}}
     """
-    catalog = _format_plugins_for_prompt(available_plugins)
+    catalog = _catalog_text(available_plugins)
     user = message.strip()
     user = user.replace("\n", " ").strip()
+    # Static planner text + catalog first, the user message last: the leading
+    # segment is identical across calls, so the API's prompt cache can reuse it.
     prompt = (
         f"{INTENT_SYSTEM}\n\n"
         f"Available plugins:\n{catalog}\n\n"
-        f"User message: \"{user}\"\n\n"
-        f"Return ONLY JSON (no prose), e.g. {{\"intent\": \"search.web\", \"target_plugin\": \"search\", \"parameters\": {{\"query\": \"...\"}}}}"
+        f"{_OUTPUT_RULE}\n\n"
+        f"User message: \"{user}\""
     )
     raw = _call_llm(prompt).strip()
     # be defensive parsing
@@ -68,7 +99,7 @@ def infer_intent(message: str, available_plugins: Dict[str, Dict[str, str]]) ->
     if start == -1 or end == -1 or end <= start:
         return {"intent": "freeform.respond", "target_plugin": "none", "parameters": {"text": message}}
     try:
-        data = json.loads(raw[start:end+1])
+        data = orjson.loads(raw[start:end+1])
         if not isinstance(data, dict): raise ValueError("not dict")
         intent = str(data.get("intent") or "freeform.respond")
         target = str(data.get("target_plugin") or "none")
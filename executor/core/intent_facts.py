@@ -1,13 +1,25 @@
 # executor/core/intent_facts.py
 from __future__ import annotations
-import os, json
+import functools, os
 from typing import Any, Dict
 
+import orjson
+
 try:
     from openai import OpenAI
-    _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""))
+    from executor.connectors.openai_shared import shared_http
 except Exception:
-    _client = None
+    OpenAI = None  # type: ignore
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Created on the first classification; None selects the keyword heuristics."""
+    if OpenAI is None:
+        return None
+    try:
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""), http_client=shared_http())
+    except Exception:
+        return None
 
 INTENT_MODEL = os.getenv("CORTEX_INTENT_MODEL") or "gpt-4o-mini"
 
@@ -27,6 +39,7 @@ Return ONLY valid JSON in this format:
 Keys should be concise (e.g. "favorite color", "location", "birthday").
 If no key/value can be determined, set them to null.
 """
+_SYSTEM_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
 
 def detect_fact_or_question(text: str) -> Dict[str, Any]:
     """Use the model to classify a message into fact/query/correction/other."""
@@ -35,7 +48,8 @@ def detect_fact_or_question(text: str) -> Dict[str, Any]:
         return {"type": "other", "key": None, "value": None}
 
     # fallback if OpenAI not available
-    if not _client:
+    client = _get_client()
+    if not client:
         lowered = text.lower()
         if "my" in lowered and (" is " in lowered or "'s " in lowered):
             parts = lowered.split("my", 1)[-1].strip()
@@ -48,10 +62,10 @@ def detect_fact_or_question(text: str) -> Dict[str, Any]:
         return {"type": "other", "key": None, "value": None}
 
     try:
-        resp = _client.chat.completions.create(
+        resp = client.chat.completions.create(
             model=INTENT_MODEL,
             messages=[
-                {"role": "system", "content": _SYSTEM_PROMPT},
+                _SYSTEM_MSG,
                 {"role": "user", "content": text},
             ],
             max_tokens=120,
@@ -61,7 +75,7 @@ def detect_fact_or_question(text: str) -> Dict[str, Any]:
         start, end = raw.find("{"), raw.rfind("}")
         if start == -1 or end == -1:
             return {"type": "other", "key": None, "value": None}
-        parsed = json.loads(raw[start:end + 1])
+        parsed = orjson.loads(raw[start:end + 1])
         if not isinstance(parsed, dict):
             return {"type": "other", "key": None, "value": None}
         return {
@@ -1,50 +1,61 @@
 # executor/core/language_intent.py
 from __future__ import annotations
-import os, re
+import functools, os, re
 from typing import Literal, Optional, Dict
 try:
     from openai import OpenAI
+    from executor.connectors.openai_shared import shared_http
 except Exception:
     OpenAI = None  # type: ignore
 
 IntentType = Literal["declaration", "question", "command", "meta", "other"]
 
-_client = None
-try:
-    if OpenAI:
-        _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-except Exception:
-    _client = None
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Only the LLM fallback needs it, so it is built on first use."""
+    if OpenAI is None:
+        return None
+    try:
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=shared_http())
+    except Exception:
+        return None
 
 _MODEL = os.getenv("CORTEX_INTENT_MODEL", "gpt-4o-mini")
+_RX_QUESTION = re.compile(r"^(who|what|where|when|why|how)\b")
+_RX_META = re.compile(r"^(forget|delete|remove|clear|reset|undo)\b")
+_RX_COMMAND = re.compile(r"^(please|do|can|could|would|find|search|open|start|run|tell|show|add|create|make|plan)\b")
+_RX_DECLARATION = re.compile(r"^(my|our|the|this|that|it|he|she|they|i\b|we\b|there's)\b")
+_LABELS = frozenset({"declaration", "question", "command", "meta", "other"})
+_CLASSIFY_MSG = {"role": "system", "content": "Classify as one word: declaration, question, command, meta, or other."}
 
 def classify_language_intent(text: str) -> IntentType:
     t = (text or "").strip().lower()
     if not t:
         return "other"
     # Heuristics first
-    if re.search(r"^(who|what|where|when|why|how)\b", t) or t.endswith("?"):
+    if _RX_QUESTION.search(t) or t.endswith("?"):
         return "question"
-    if re.search(r"^(forget|delete|remove|clear|reset|undo)\b", t):
+    if _RX_META.search(t):
         return "meta"
-    if re.search(r"^(please|do|can|could|would|find|search|open|start|run|tell|show|add|create|make|plan)\b", t):
+    if _RX_COMMAND.search(t):
         return "command"
-    if re.search(r"^(my|our|the|this|that|it|he|she|they|i\b|we\b|there's)\b", t):
+    if _RX_DECLARATION.search(t):
         return "declaration"
     # LLM fallback (optional)
-    if _client:
+    client = _get_client()
+    if client:
         try:
-            resp = _client.chat.completions.create(
+            resp = client.chat.completions.create(
                 model=_MODEL,
                 messages=[
-                    {"role": "system", "content": "Classify as one word: declaration, question, command, meta, or other."},
+                    _CLASSIFY_MSG,
                     {"role": "user", "content": text},
                 ],
                 max_tokens=2,
                 temperature=0,
             )
             out = (resp.choices[0].message.content or "").strip().lower()
-            if out in {"declaration", "question", "command", "meta", "other"}:
+            if out in _LABELS:
                 return out  # type: ignore
         except Exception:
             pass
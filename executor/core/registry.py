@@ -27,7 +27,7 @@ else:
 from importlib import import_module
 from pathlib import Path
 import json, sys, importlib
-from typing import Dict, Optional, Set
+from typing import Any, Dict, Optional, Set, Tuple
 
 from executor.audit.logger import get_logger
 from executor.utils.config import ensure_dirs
@@ -35,6 +35,22 @@ from executor.utils.memory import init_db_if_needed
 
 logger = get_logger(__name__)
 
+# manifest path -> ((st_ino, st_mtime_ns, st_size), parsed plugin.json); shared by every Registry.
+# st_ino catches a same-size replace that lands inside one coarse mtime tick.
+_MANIFEST_CACHE: Dict[str, Tuple[Tuple[int, int, int], Dict[str, Any]]] = {}
+
+def _read_manifest(path: Path) -> Dict[str, Any]:
+    """Parsed plugin.json, re-read only when the file changed since the last refresh."""
+    st = path.stat()
+    sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+    key = str(path)
+    hit = _MANIFEST_CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    data = json.loads(path.read_text(encoding="utf-8"))
+    _MANIFEST_CACHE[key] = (sig, data)
+    return data
+
 class Registry:
     def __init__(self, root: Optional[Path] = None, base: Optional[str] = None):
         ensure_dirs()
@@ -58,7 +74,7 @@ class Registry:
             return
         for manifest_path in self.plugins_dir.rglob("plugin.json"):
             try:
-                data = json.loads(manifest_path.read_text(encoding="utf-8"))
+                data = _read_manifest(manifest_path)
                 name = data.get("name", "")
                 caps = data.get("capabilities", []) or []
                 spec = data.get("specialist")
@@ -2,8 +2,9 @@
 from __future__ import annotations
 from typing import Any, Dict
 from pathlib import Path
-import json, time, re
-from executor.core.intent import infer_intent
+import hashlib, json, time, re
+import orjson
+from executor.core.intent import INTENT_MODEL, INTENT_SYSTEM, infer_intent
 from executor.utils.memory import list_facts
 
 # ---------------------------------------------------------------------------
@@ -12,34 +13,74 @@ from executor.utils.memory import list_facts
 _CACHE_PATH = Path("/data") / "intent_cache.json"
 _CACHE_TTL = 3600  # seconds (1 hour)
 
+_RX_SELF_REF = re.compile(r"\b(my|mine|i|me)\b")
+_SELF_QUESTIONS = ("what", "who", "where", "when")
+
+# (st_ino, st_mtime_ns, st_size) of the file last parsed or written, and its contents (read-only);
+# st_ino catches a same-size replace that lands inside one coarse mtime tick
+_CACHE_MEMO: Dict[str, Any] = {"sig": None, "data": {}}
+
+def _cache_sig():
+    st = _CACHE_PATH.stat()
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
 def _load_cache() -> Dict[str, Dict[str, Any]]:
     try:
-        if _CACHE_PATH.exists():
-            return json.loads(_CACHE_PATH.read_text())
-    except Exception:
-        pass
-    return {}
+        sig = _cache_sig()
+        if sig == _CACHE_MEMO["sig"]:
+            return _CACHE_MEMO["data"]
+        data = orjson.loads(_CACHE_PATH.read_bytes())
+    except Exception:  # missing file included; no separate exists() stat
+        return {}
+    _CACHE_MEMO.update(sig=sig, data=data)
+    return data
 
 def _save_cache(cache: Dict[str, Any]) -> None:
     try:
-        _CACHE_PATH.write_text(json.dumps(cache, indent=2))
+        _CACHE_PATH.write_bytes(orjson.dumps(cache))
+        _CACHE_MEMO.update(sig=_cache_sig(), data=cache)
     except Exception:
         pass
 
-def _get_cached_intent(text: str) -> Dict[str, Any] | None:
+def _intent_key(text: str) -> str:
+    """sha256 over (model, planner prompt, plugin catalog, text): a prompt or catalog edit misses."""
+    h = hashlib.sha256(_KEY_PREFIX)
+    h.update(text.encode("utf-8"))
+    return h.hexdigest()
+
+def _get_cached_intent(key: str) -> Dict[str, Any] | None:
     cache = _load_cache()
-    entry = cache.get(text)
+    entry = cache.get(key)
     if not entry:
         return None
     if time.time() - entry.get("ts", 0) > _CACHE_TTL:
         return None
     return entry.get("plan")
 
-def _set_cached_intent(text: str, plan: Dict[str, Any]) -> None:
+def _set_cached_intent(key: str, plan: Dict[str, Any]) -> None:
     cache = _load_cache()
-    cache[text] = {"plan": plan, "ts": time.time()}
+    now = time.time()
+    # drop expired entries (and any left over from an older key scheme) while rewriting anyway
+    cache = {k: v for k, v in cache.items()
+             if isinstance(v, dict) and now - v.get("ts", 0) <= _CACHE_TTL}
+    cache[key] = {"plan": plan, "ts": now}
     _save_cache(cache)
 
+# ---------------------------------------------------------------------------
+# Plugin catalog offered to the intent planner (fixed; treat as read-only so
+# infer_intent can reuse its formatted prompt block)
+# ---------------------------------------------------------------------------
+AVAILABLE_PLUGINS: Dict[str, Dict[str, str]] = {
+    "web_search": {"description": "Perform general or factual web/news searches."},
+    "weather_plugin": {"description": "Get current or forecasted weather data."},
+    "google_places": {"description": "Find nearby businesses, attractions, or places."},
+    "feedback": {"description": "Record explicit feedback about Cortex's performance."},
+}
+
+_KEY_PREFIX = hashlib.sha256(
+    json.dumps([INTENT_MODEL, INTENT_SYSTEM, AVAILABLE_PLUGINS], sort_keys=True).encode("utf-8")
+).digest()
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -94,21 +135,17 @@ def route(
 
     # --- SELF-REFERENCE OVERRIDE (restored from 2.7-green) ---
     # If user asks about themselves, keep it in brain/memory path
-    if re.search(r"\b(my|mine|i|me)\b", text.lower()):
-        if any(q in text.lower() for q in ("what", "who", "where", "when")):
+    low = text.lower()
+    if _RX_SELF_REF.search(low):
+        if any(q in low for q in _SELF_QUESTIONS):
             return _base_response("Okay — let me think about that.")
 
     # --- Try cached plan first ---
-    plan = _get_cached_intent(text)
+    key = _intent_key(text)
+    plan = _get_cached_intent(key)
     if not plan:
-        available_plugins = {
-            "web_search": {"description": "Perform general or factual web/news searches."},
-            "weather_plugin": {"description": "Get current or forecasted weather data."},
-            "google_places": {"description": "Find nearby businesses, attractions, or places."},
-            "feedback": {"description": "Record explicit feedback about Cortex's performance."},
-        }
-        plan = infer_intent(text, available_plugins)
-        _set_cached_intent(text, plan)
+        plan = infer_intent(text, AVAILABLE_PLUGINS)
+        _set_cached_intent(key, plan)
 
     plugin = plan.get("target_plugin", "none")
     params = plan.get("parameters", {})
@@ -1,13 +1,25 @@
 # executor/core/semantic_intent.py
 from __future__ import annotations
-import os, re, json
+import functools, os, re
 from typing import Any, Dict, Optional
 
+import orjson
+
 try:
     from openai import OpenAI
-    _client = OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""))
+    from executor.connectors.openai_shared import shared_http
 except Exception:
-    _client = None
+    OpenAI = None  # type: ignore
+
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Created lazily; None leaves inference to the regex rules."""
+    if OpenAI is None:
+        return None
+    try:
+        return OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""), http_client=shared_http())
+    except Exception:
+        return None
 
 INTENT_MODEL = os.getenv("CORTEX_INTENT_MODEL") or "gpt-4o-mini"
 
@@ -35,6 +47,7 @@ Rules:
 - If unsure, choose "smalltalk" with low confidence.
 Return ONLY the JSON.
 """
+_INTENT_SYSTEM_MSG = {"role": "system", "content": _INTENT_SYSTEM}
 
 # --- Regex fallback when API key or model unavailable or on error ---
 _RX_UPDATE = re.compile(
@@ -106,16 +119,17 @@ def analyze(text: str, history: Optional[list[dict]] = None) -> Dict[str, Any]:
         return {"intent": "fact.delete", "domain": None, "key": key, "value": None, "scope": None, "confidence": 0.9}
 
     # Try LLM if available for richer inference (domain inference)
-    if _client:
+    client = _get_client()
+    if client:
         try:
             messages = [
-                {"role":"system","content":_INTENT_SYSTEM},
+                _INTENT_SYSTEM_MSG,
                 {"role":"user","content":t},
             ]
-            resp = _client.chat.completions.create(model=INTENT_MODEL, messages=messages, temperature=0)
+            resp = client.chat.completions.create(model=INTENT_MODEL, messages=messages, temperature=0)
             raw = resp.choices[0].message.content or "{}"
             jstart, jend = raw.find("{"), raw.rfind("}")
-            parsed = json.loads(raw[jstart:jend+1]) if jstart != -1 and jend != -1 else {}
+            parsed = orjson.loads(raw[jstart:jend+1]) if jstart != -1 and jend != -1 else {}
             intent = str(parsed.get("intent","smalltalk"))
             domain = parsed.get("domain")
             key = _canon_key(parsed.get("key"))
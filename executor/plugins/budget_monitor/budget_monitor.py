@@ -3,36 +3,134 @@ Budget Monitor plugin
 Tracks token usage and enforces a daily budget limit.
 """
 
+import atexit
 import os
-import json
+import queue
+import threading
 from datetime import date
 from pathlib import Path
+from typing import Iterable
+
+import orjson
+
+try:
+    import tiktoken  # optional: exact BPE counts instead of the chars/4 guess
+except ImportError:
+    tiktoken = None
 
 BUDGET_PATH = Path(os.environ.get("BUDGET_MONITOR_PATH", ".executor/budget.json"))
 DAILY_LIMIT = int(os.environ.get("BUDGET_MONITOR_DAILY_LIMIT", "100000"))  # tokens/day default
 
+# Fire-and-forget usage queue, drained by a single background writer
+_USAGE_Q: "queue.Queue[int]" = queue.Queue(maxsize=10_000)
+_WRITER: threading.Thread | None = None
+_WRITER_LOCK = threading.Lock()
+# held by the writer from its first dequeued entry until that batch is saved
+_FLUSH_LOCK = threading.Lock()
+_BATCH_MAX = 100
+_BATCH_WAIT = 0.05  # seconds
+
+_ENCODING = os.environ.get("BUDGET_MONITOR_ENCODING", "o200k_base")
+_ENC = None
+
+def _encoder():
+    global _ENC, tiktoken
+    if _ENC is None and tiktoken is not None:
+        try:
+            _ENC = tiktoken.get_encoding(_ENCODING)
+        except Exception:
+            tiktoken = None  # encoding unavailable (e.g. offline); stay on the approximation
+    return _ENC
+
+def load_encoder() -> None:
+    """Resolve the tiktoken encoding now; the first get_encoding may download its BPE file."""
+    _encoder()
+
+def estimate_tokens(text: str, load: bool = True) -> int:
+    """
+    Token count of text: tiktoken when installed, else ~4 chars per token.
+    load=False never resolves the encoding here (safe on an event loop); it
+    uses the approximation until load_encoder() has run.
+    """
+    if not text:
+        return 0
+    enc = _encoder() if load else _ENC
+    if enc is not None:
+        return len(enc.encode_ordinary(text))
+    return (len(text) + 3) >> 2
+
 def _load() -> dict:
-    if not BUDGET_PATH.exists():
-        return {"date": str(date.today()), "used": 0}
     try:
-        return json.loads(BUDGET_PATH.read_text(encoding="utf-8"))
-    except Exception:
+        return orjson.loads(BUDGET_PATH.read_bytes())
+    except Exception:  # includes FileNotFoundError: no exists() pre-check
         return {"date": str(date.today()), "used": 0}
 
 def _save(data: dict) -> None:
     BUDGET_PATH.parent.mkdir(parents=True, exist_ok=True)
-    BUDGET_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    BUDGET_PATH.write_bytes(orjson.dumps(data))
 
 def record_usage(tokens: int) -> dict:
     """Record token usage for today."""
+    return record_usage_batch([tokens])
+
+def record_usage_batch(batch: Iterable[int]) -> dict:
+    """Record several usage entries with a single load/save."""
     data = _load()
     today = str(date.today())
     if data.get("date") != today:
         data = {"date": today, "used": 0}
-    data["used"] += int(tokens)
+    data["used"] += sum(int(t) for t in batch)
     _save(data)
     return data
 
+def _drain_forever() -> None:
+    while True:
+        batch = [_USAGE_Q.get()]
+        with _FLUSH_LOCK:
+            try:
+                while len(batch) < _BATCH_MAX:
+                    batch.append(_USAGE_Q.get(timeout=_BATCH_WAIT))
+            except queue.Empty:
+                pass
+            try:
+                record_usage_batch(batch)
+            except Exception:
+                pass
+
+def _drain_at_exit() -> None:
+    """Save usage still queued at shutdown; the daemon writer is not joined."""
+    with _FLUSH_LOCK:
+        batch = []
+        try:
+            while True:
+                batch.append(_USAGE_Q.get_nowait())
+        except queue.Empty:
+            pass
+        if batch:
+            try:
+                record_usage_batch(batch)
+            except Exception:
+                pass
+
+atexit.register(_drain_at_exit)
+
+def record_usage_nowait(tokens: int) -> bool:
+    """
+    Queue token usage for the background writer and return immediately.
+    Returns False (entry dropped) if the queue is full.
+    """
+    global _WRITER
+    if _WRITER is None:
+        with _WRITER_LOCK:
+            if _WRITER is None:
+                _WRITER = threading.Thread(target=_drain_forever, name="budget-writer", daemon=True)
+                _WRITER.start()
+    try:
+        _USAGE_Q.put_nowait(int(tokens))
+        return True
+    except queue.Full:
+        return False
+
 def check_budget() -> dict:
     """Check budget status: { ok, used, limit }"""
     data = _load()
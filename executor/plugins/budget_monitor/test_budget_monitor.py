@@ -5,3 +5,37 @@ def test_record_and_check():
     assert "used" in state
     res = budget_monitor.check_budget()
     assert "ok" in res and "used" in res and "limit" in res
+
+def test_record_usage_batch_sums_entries(monkeypatch, tmp_path):
+    monkeypatch.setattr(budget_monitor, "BUDGET_PATH", tmp_path / "budget.json")
+    state = budget_monitor.record_usage_batch([3, 4, 5])
+    assert state["used"] == 12
+    assert budget_monitor.check_budget()["used"] == 12
+
+def test_estimate_tokens_empty_and_nonempty():
+    assert budget_monitor.estimate_tokens("") == 0
+    assert budget_monitor.estimate_tokens("hello world") > 0
+
+
+def test_load_encoder_is_safe_to_call_first():
+    # falls back to the approximation when tiktoken or its BPE file is unavailable
+    budget_monitor.load_encoder()
+    assert budget_monitor.estimate_tokens("hello world") > 0
+
+
+def test_estimate_tokens_without_load_never_resolves_encoding(monkeypatch):
+    def fail():
+        raise AssertionError("encoding resolved on the caller's thread")
+
+    monkeypatch.setattr(budget_monitor, "_ENC", None)
+    monkeypatch.setattr(budget_monitor, "_encoder", fail)
+    assert budget_monitor.estimate_tokens("hello world", load=False) == 3
+
+
+def test_usage_still_queued_at_exit_is_saved(monkeypatch, tmp_path):
+    monkeypatch.setattr(budget_monitor, "BUDGET_PATH", tmp_path / "budget.json")
+    for n in (2, 3):
+        budget_monitor._USAGE_Q.put_nowait(n)  # queued, writer not involved
+    budget_monitor._drain_at_exit()
+    assert budget_monitor.check_budget()["used"] == 5
+    assert budget_monitor._USAGE_Q.empty()
@@ -1,13 +1,26 @@
 from __future__ import annotations
 from pathlib import Path
-import json
+import os
+import re
 from typing import Dict, Any, List
 
+import orjson
+
 from executor.audit.logger import get_logger
+from executor.utils.atomic_write import write_atomic
 
 logger = get_logger(__name__)
 
 _MEM_DIR = str(Path(".executor") / "memory")
+# Opening turns always kept ahead of the recent window (stable, cache-friendly prefix)
+HISTORY_HEAD = int(os.environ.get("CORTEX_HISTORY_HEAD", "0"))
+
+# path -> ((st_ino, st_mtime_ns, st_size), parsed JSON); os.replace always changes st_ino,
+# which catches a same-size rewrite inside one coarse mtime tick
+_JSON_CACHE: Dict[str, Any] = {}
+
+# "favorite <kind> is <rest of text>"; lookahead so overlapping facts are all seen
+RX_FACT = re.compile(r"favorite (color|food) is (?=(.*))", re.S)
 
 
 def _mem_path(name: str) -> Path:
@@ -17,29 +30,45 @@ def _mem_path(name: str) -> Path:
 
 
 def _read_json(p: Path) -> Dict[str, Any]:
-    if not p.exists():
+    """Parsed file contents, re-read only when its inode/mtime/size changed. Treat as read-only."""
+    try:
+        st = p.stat()
+    except FileNotFoundError:
         return {}
+    sig = (st.st_ino, st.st_mtime_ns, st.st_size)
+    hit = _JSON_CACHE.get(str(p))
+    if hit is not None and hit[0] == sig:
+        return hit[1]
     try:
-        return json.loads(p.read_text(encoding="utf-8"))
+        data = orjson.loads(p.read_bytes())
     except Exception:
         return {}
+    _JSON_CACHE[str(p)] = (sig, data)
+    return data
 
 
 def _write_json(p: Path, data: Dict[str, Any]) -> None:
-    p.parent.mkdir(parents=True, exist_ok=True)
-    p.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    """Replace p atomically so a crash or a concurrent save cannot truncate saved facts."""
+    write_atomic(p, orjson.dumps(data))
 
 
 def load_facts(session: str) -> Dict[str, Any]:
     data = _read_json(_mem_path("repl_facts.json"))
-    return data.get(session, {})
+    return dict(data.get(session, {}))
 
 
 def save_fact(session: str, key: str, value: Any) -> None:
-    data = _read_json(_mem_path("repl_facts.json"))
-    sess = data.setdefault(session, {})
-    sess[key] = value
-    _write_json(_mem_path("repl_facts.json"), data)
+    save_facts(session, {key: value})
+
+
+def save_facts(session: str, updates: Dict[str, Any]) -> None:
+    """Apply several fact updates with one read and one rewrite of the facts file."""
+    path = _mem_path("repl_facts.json")
+    data = dict(_read_json(path))
+    sess = dict(data.get(session, {}))
+    sess.update(updates)
+    data[session] = sess
+    _write_json(path, data)
 
 
 def handle_repl_turn(
@@ -47,17 +76,24 @@ def handle_repl_turn(
     history: List[Dict[str, str]] | None = None,
     session: str = "default",
     limit: int = 10,
+    head: int | None = None,
 ) -> Dict[str, Any]:
     history = history or []
-    limited = history[-limit:] if history else []
+    head = HISTORY_HEAD if head is None else head
+    if head > 0 and len(history) > head + limit:
+        # drop the middle, never rewrite: the first turns stay byte-identical
+        messages = history[:head] + history[-limit:]
+    else:
+        messages = history[-limit:] if history else []
 
     text = (user_text or "").lower().strip()
-    if "favorite color is" in text:
-        val = text.split("favorite color is", 1)[1].strip().strip(".")
-        save_fact(session, "favorite_color", val)
-    if "favorite food is" in text:
-        val = text.split("favorite food is", 1)[1].strip().strip(".")
-        save_fact(session, "favorite_food", val)
-
-    messages = limited + [{"role": "user", "content": user_text}]
+    if "favorite" in text:
+        found: Dict[str, Any] = {}
+        for m in RX_FACT.finditer(text):
+            found.setdefault(f"favorite_{m.group(1)}", m.group(2).strip().strip("."))
+        if found:
+            save_facts(session, found)
+
+    # the window is already a fresh list; append instead of concatenating a second copy
+    messages.append({"role": "user", "content": user_text})
     return {"status": "ok", "messages": messages, "message": user_text}
\ No newline at end of file
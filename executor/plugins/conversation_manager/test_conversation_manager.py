@@ -47,6 +47,14 @@ def test_fact_extraction_color_and_food(tmp_path):
     assert facts.get("favorite_food") == "pizza"
 
 
+def test_two_facts_in_one_turn_are_both_saved():
+    session = "both_facts"
+    cm.handle_repl_turn("My favorite color is red and my favorite food is soup.", session=session)
+    facts = cm.load_facts(session)
+    assert facts["favorite_color"].startswith("red")
+    assert facts["favorite_food"] == "soup"
+
+
 def test_limit_history(tmp_path):
     session = "limit_test"
     hist = [{"role": "user", "content": f"msg {i}"} for i in range(20)]
@@ -56,3 +64,56 @@ def test_limit_history(tmp_path):
     # Only the last 5 from history + 1 new
     assert len(messages) == 6
     assert messages[-1]["content"] == "latest msg"
+
+
+def test_head_and_tail_window():
+    hist = [{"role": "user", "content": f"msg {i}"} for i in range(20)]
+    turn = cm.handle_repl_turn("latest msg", history=hist, session="window", limit=3, head=2)
+    contents = [m["content"] for m in turn["messages"]]
+
+    assert contents == ["msg 0", "msg 1", "msg 17", "msg 18", "msg 19", "latest msg"]
+
+
+def test_load_facts_sees_external_file_changes():
+    session = "mtime_test"
+    cm.save_fact(session, "favorite_color", "blue")
+    assert cm.load_facts(session)["favorite_color"] == "blue"
+
+    p = cm._mem_path("repl_facts.json")
+    p.write_text(json.dumps({session: {"favorite_color": "green!"}}), encoding="utf-8")
+    assert cm.load_facts(session)["favorite_color"] == "green!"
+
+
+def test_load_facts_sees_same_size_replace_within_one_mtime_tick():
+    session = "same_size"
+    cm.save_fact(session, "favorite_color", "blue")
+    p = cm._mem_path("repl_facts.json")
+    before = p.stat()
+    assert cm.load_facts(session)["favorite_color"] == "blue"
+
+    # same byte length, swapped in with os.replace, mtime pinned as a coarse clock would leave it
+    tmp = p.with_name("replacement.json")
+    tmp.write_text(p.read_text(encoding="utf-8").replace("blue", "pink"), encoding="utf-8")
+    os.replace(tmp, p)
+    os.utime(p, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert p.stat().st_size == before.st_size
+
+    assert cm.load_facts(session)["favorite_color"] == "pink"
+
+
+def test_concurrent_saves_leave_valid_file_and_no_temp_files():
+    import threading
+
+    def worker(n):
+        for i in range(20):
+            cm.save_fact(f"thread_{n}", "count", i)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    memdir = cm._mem_path("repl_facts.json").parent
+    json.loads((memdir / "repl_facts.json").read_text(encoding="utf-8"))
+    assert [n for n in os.listdir(memdir) if n.endswith(".tmp")] == []
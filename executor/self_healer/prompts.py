@@ -7,12 +7,12 @@ HEADER = (
     "```patch:<repo-relative-path>\n<full file content>\n```\n"
     "Never include partial diffs; always output full file content."
 )
+# the system message never changes; only the user message is per-failure
+_SYS_MSG = {"role": "system", "content": HEADER}
 
 
 def build_messages(failure_cluster: List[Dict[str, str]], repo_outline: str) -> List[Dict[str, str]]:
     """Builds the system + user messages for LLM chat requests."""
-    sys_msg = {"role": "system", "content": HEADER}
-
     user_lines = ["Repository Outline:", repo_outline, "\nFailures to fix:"]
     for f in failure_cluster:
         user_lines.append(
@@ -21,4 +21,4 @@ def build_messages(failure_cluster: List[Dict[str, str]], repo_outline: str) ->
         )
 
     user_msg = {"role": "user", "content": "\n".join(user_lines)}
-    return [sys_msg, user_msg]
\ No newline at end of file
+    return [_SYS_MSG, user_msg]
\ No newline at end of file
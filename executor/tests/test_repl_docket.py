@@ -1,7 +1,9 @@
 import os
 import sys
 import io
+import json
 import importlib
+import shutil
 import pytest
 
 from executor.utils.docket import Docket
@@ -78,6 +80,103 @@ def test_repl_smoke_normal_flow(monkeypatch, tmp_memory, capsys):
     assert any(t["title"] == "do something" for t in tasks)
 
 
+def _offline_route(text):
+    return {"assistant_message": "", "actions": []}
+
+
+class FactsAndTaskClient:
+    def chat(self, messages, response_format=None):
+        return (
+            '{"assistant_message": "Hello!", '
+            '"facts_to_save":[{"key":"foo","value":"bar"}], '
+            '"tasks_to_add":[{"title":"do something","priority":"high"}]}'
+        )
+
+
+def test_repl_merges_facts_into_mixed_facts_file(monkeypatch, tmp_memory):
+    """Top-level non-dict values and other sessions in repl_facts.json must survive a REPL turn."""
+    repl = importlib.reload(importlib.import_module("executor.connectors.repl"))
+    monkeypatch.setattr(repl, "OpenAIClient", lambda: FactsAndTaskClient())
+    monkeypatch.setattr(repl.router, "route", _offline_route)
+    facts_file = tmp_memory / "repl_facts.json"
+    facts_file.write_text(json.dumps({
+        "repl": {"old": "kept"},
+        "interaction_style": "chat-first",
+        "scroll_to_bottom_button": True,
+        "default": {"favorite_color": "blue"},
+    }))
+
+    sys.stdin = io.StringIO("hello\nquit\n")
+    repl.main()
+
+    facts = json.loads(facts_file.read_text())
+    assert facts["repl"] == {"old": "kept", "foo": "bar"}
+    assert facts["interaction_style"] == "chat-first"
+    assert facts["scroll_to_bottom_button"] is True
+    assert facts["default"] == {"favorite_color": "blue"}
+
+    tasks = [json.loads(l) for l in (tmp_memory / "repl_tasks.jsonl").read_text().splitlines()]
+    assert tasks == [{"title": "do something", "priority": "high"}]
+
+
+def test_repl_facts_visible_to_other_writers_between_turns(monkeypatch, tmp_memory):
+    """Facts land in repl_facts.json every turn, and a write by another module in between is kept."""
+    repl = importlib.reload(importlib.import_module("executor.connectors.repl"))
+    monkeypatch.setattr(repl, "OpenAIClient", lambda: FactsAndTaskClient())
+    monkeypatch.setattr(repl.router, "route", _offline_route)
+    facts_file = tmp_memory / "repl_facts.json"
+
+    sys.stdin = io.StringIO("hello\n")
+    repl.main()
+    assert json.loads(facts_file.read_text())["repl"] == {"foo": "bar"}
+
+    data = json.loads(facts_file.read_text())
+    data["default"] = {"favorite_food": "soup"}
+    facts_file.write_text(json.dumps(data))
+
+    sys.stdin = io.StringIO("hello again\nquit\n")
+    repl.main()
+    facts = json.loads(facts_file.read_text())
+    assert facts["default"] == {"favorite_food": "soup"}
+    assert facts["repl"] == {"foo": "bar"}
+
+
+def test_repl_survives_memory_dir_removed_between_turns(monkeypatch, tmp_memory):
+    """Cached dirs, append descriptors and skipped rewrites must notice the files vanished."""
+    repl = importlib.reload(importlib.import_module("executor.connectors.repl"))
+    monkeypatch.setattr(repl, "OpenAIClient", lambda: FactsAndTaskClient())
+    monkeypatch.setattr(repl.router, "route", _offline_route)
+
+    sys.stdin = io.StringIO("hello\n")
+    repl.main()
+    shutil.rmtree(tmp_memory)
+
+    sys.stdin = io.StringIO("hello again\nquit\n")
+    repl.main()
+
+    assert (tmp_memory / "repl_actions.json").exists()
+    assert json.loads((tmp_memory / "repl_facts.json").read_text())["repl"] == {"foo": "bar"}
+    assert len((tmp_memory / "repl_tasks.jsonl").read_text().splitlines()) == 1
+
+
+def test_write_json_skips_only_while_file_is_unchanged(tmp_memory):
+    repl = importlib.reload(importlib.import_module("executor.connectors.repl"))
+    p = tmp_memory / "repl_actions.json"
+
+    repl._write_json(p, [])
+    before = os.stat(p).st_ino
+    repl._write_json(p, [])
+    assert os.stat(p).st_ino == before  # identical bytes: no rewrite
+
+    os.remove(p)
+    repl._write_json(p, [])
+    assert json.loads(p.read_text()) == []
+
+    p.write_text('[{"plugin": "x"}]')
+    repl._write_json(p, [])
+    assert json.loads(p.read_text()) == []
+
+
 def test_scheduler_smoke(monkeypatch, tmp_memory):
     """Smoke test scheduler process_once with stubbed OpenAIClient."""
     scheduler = importlib.reload(importlib.import_module("executor.middleware.scheduler"))
@@ -0,0 +1,47 @@
+"""
+executor/utils/atomic_write.py
+------------------------------
+Crash-safe replacement of small state files, shared by the REPL and
+conversation_manager (both write .executor/memory/repl_facts.json).
+"""
+
+from __future__ import annotations
+import os
+import tempfile
+from pathlib import Path
+
+# CORTEX_FSYNC=1 trades speed for durability: state files are forced to disk
+# before they replace the old copy, and append-only logs after each write
+FSYNC = os.environ.get("CORTEX_FSYNC", "false").lower() in ("1", "true", "yes")
+
+
+def _mkstemp_beside(p: Path):
+    try:
+        return tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+    except FileNotFoundError:
+        # the directory was removed behind the caller's back
+        p.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.mkstemp(dir=p.parent, prefix=f".{p.name}.", suffix=".tmp")
+
+
+def write_atomic(p: Path, payload: bytes) -> None:
+    """
+    Replace p with payload via a unique sibling temp file and os.replace, so a
+    crash or a concurrent writer leaves the old or the new file, never half of one.
+    """
+    fd, tmp = _mkstemp_beside(p)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), 0o644)  # mkstemp creates 0600
+            f.write(payload)
+            if FSYNC:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, p)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -180,15 +180,18 @@ def detect_domain_from_key(key: str) -> str:
 # ---------------------------------------------------------------------
 # NEGATION & TOPIC HELPERS
 # ---------------------------------------------------------------------
+_RX_NEGATION = re.compile(r"\b(not|no|never|nevermind)\b")
+_RX_TOPIC_INTRO = re.compile(r"(?i)\b(let'?s\s+talk\s+about|switch\s+to|change\s+topic\s+to)\b(.+)")
+
 def contains_negation(text: str) -> bool:
     if not text:
         return False
-    return bool(re.search(r"\b(not|no|never|nevermind)\b", text.lower()))
+    return bool(_RX_NEGATION.search(text.lower()))
 
 def extract_topic_intro(text: str) -> Optional[str]:
     if not text:
         return None
-    m = re.search(r"(?i)\b(let'?s\s+talk\s+about|switch\s+to|change\s+topic\s+to)\b(.+)", text.strip())
+    m = _RX_TOPIC_INTRO.search(text.strip())
     if m:
         return m.group(2).strip(" .!?")
     return None
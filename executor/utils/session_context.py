@@ -5,10 +5,12 @@ Phase 2.20 — session context + tone + reminder interval + pending confirmation
 """
 
 from __future__ import annotations
-import sqlite3, json
+import sqlite3
 from pathlib import Path
 from typing import Optional, Tuple
 
+import orjson
+
 DB_PATH = Path("/data/memory.db")
 
 # ---------- DB helpers ----------
@@ -144,7 +146,7 @@ def set_pending(session_id: str, payload: dict) -> None:
           INSERT INTO session_context(session_id,pending)
           VALUES(?,?)
           ON CONFLICT(session_id) DO UPDATE SET pending=excluded.pending
-        """, (session_id, json.dumps(payload)))
+        """, (session_id, orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")))
         c.commit()
 
 def get_pending(session_id: str) -> Optional[dict]:
@@ -152,7 +154,7 @@ def get_pending(session_id: str) -> Optional[dict]:
         r = c.execute("SELECT pending FROM session_context WHERE session_id=?", (session_id,)).fetchone()
     if not r or not r["pending"]: return None
     try:
-        return json.loads(r["pending"])
+        return orjson.loads(r["pending"])
     except Exception:
         return None
 
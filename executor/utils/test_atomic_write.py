@@ -0,0 +1,37 @@
+"""
+Tests for atomic_write.py
+"""
+
+import os
+
+import pytest
+import executor.utils.atomic_write as aw
+
+
+def test_write_atomic_replaces_file_and_leaves_no_temp(tmp_path):
+    p = tmp_path / "state.json"
+    p.write_bytes(b"old")
+    aw.write_atomic(p, b"new")
+    assert p.read_bytes() == b"new"
+    assert os.listdir(tmp_path) == ["state.json"]
+    assert p.stat().st_mode & 0o777 == 0o644
+
+
+def test_write_atomic_recreates_missing_directory(tmp_path):
+    p = tmp_path / "gone" / "state.json"
+    aw.write_atomic(p, b"{}")
+    assert p.read_bytes() == b"{}"
+
+
+def test_failed_write_keeps_old_file_and_removes_temp(tmp_path, monkeypatch):
+    p = tmp_path / "state.json"
+    p.write_bytes(b"old")
+
+    def boom(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(aw.os, "replace", boom)
+    with pytest.raises(OSError):
+        aw.write_atomic(p, b"new")
+    assert p.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["state.json"]
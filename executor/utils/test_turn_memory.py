@@ -0,0 +1,60 @@
+"""
+Tests for turn_memory.py
+Validates the recent-turns window cache against the SQLite turn log.
+"""
+
+from collections import OrderedDict
+
+import pytest
+import executor.utils.turn_memory as tm
+
+
+@pytest.fixture(autouse=True)
+def temp_db(monkeypatch, tmp_path):
+    monkeypatch.setattr(tm, "DB_PATH", tmp_path / "memory.db")
+    monkeypatch.setattr(tm, "_RECENT_CACHE", OrderedDict())
+    tm._ensure()
+
+
+def _texts(turns):
+    return [t["text"] for t in turns]
+
+
+def test_cached_window_follows_new_turns():
+    for i in range(5):
+        tm.add_turn("user", f"m{i}", session_id="s")
+    assert _texts(tm.get_recent_turns("s", limit=3)) == ["m2", "m3", "m4"]
+
+    tm.add_turn("assistant", "m5", session_id="s")
+    assert _texts(tm.get_recent_turns("s", limit=3)) == ["m3", "m4", "m5"]
+    assert _texts(tm.get_recent_turns("s", limit=3)) == _texts(tm._query_recent("s", 3))
+
+
+def test_add_turn_only_touches_its_own_session():
+    tm.add_turn("user", "a1", session_id="a")
+    tm.add_turn("user", "b1", session_id="b")
+    tm.get_recent_turns("a", limit=2)
+    tm.get_recent_turns("b", limit=2)
+
+    tm.add_turn("user", "a2", session_id="a")
+    assert _texts(tm.get_recent_turns("a", limit=2)) == ["a1", "a2"]
+    assert _texts(tm.get_recent_turns("b", limit=2)) == ["b1"]
+
+
+def test_cache_is_bounded_and_evicts_least_recent_session(monkeypatch):
+    monkeypatch.setattr(tm, "_RECENT_MAX_SESSIONS", 2)
+    for sid in ("a", "b"):
+        tm.add_turn("user", sid, session_id=sid)
+        tm.get_recent_turns(sid, limit=4)
+    tm.get_recent_turns("a", limit=4)  # "a" is now the most recent
+    tm.get_recent_turns("c", limit=4)
+
+    assert list(tm._RECENT_CACHE) == ["a", "c"]
+
+
+def test_non_positive_limit_is_not_cached():
+    for i in range(3):
+        tm.add_turn("user", f"m{i}", session_id="s")
+    assert tm.get_recent_turns("s", limit=0) == []
+    assert _texts(tm.get_recent_turns("s", limit=-1)) == ["m0", "m1", "m2"]
+    assert "s" not in tm._RECENT_CACHE
@@ -5,12 +5,20 @@ Phase 2.19 — minimal turn log with get_recent_turns/add_turn helpers
 """
 
 from __future__ import annotations
-import sqlite3, time
+import os, sqlite3, time, threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict
 
 DB_PATH = Path("/data/memory.db")
 
+# In-process LRU of recent-turn windows: session_id -> {limit: turns}, at most
+# _RECENT_MAX_SESSIONS sessions. add_turn appends to that session's cached windows
+# instead of forcing a re-query.
+_RECENT_MAX_SESSIONS = int(os.getenv("CORTEX_TURN_CACHE_SESSIONS", "256"))
+_RECENT_CACHE: "OrderedDict[str, Dict[int, List[Dict]]]" = OrderedDict()
+_RECENT_LOCK = threading.Lock()
+
 def _conn():
     c = sqlite3.connect(DB_PATH.as_posix(), check_same_thread=False)
     c.row_factory = sqlite3.Row
@@ -32,15 +40,42 @@ def _ensure():
 _ensure()
 
 def add_turn(role: str, text: str, session_id: str = "default") -> None:
-    with _conn() as c:
-        c.execute("INSERT INTO turns(session_id,role,content,created_at) VALUES(?,?,?,?)",
-                  (session_id, role, text, int(time.time())))
-        c.commit()
+    created_at = int(time.time())
+    with _RECENT_LOCK:
+        with _conn() as c:
+            c.execute("INSERT INTO turns(session_id,role,content,created_at) VALUES(?,?,?,?)",
+                      (session_id, role, text, created_at))
+            c.commit()
+        windows = _RECENT_CACHE.get(session_id)
+        if windows is None:
+            return
+        _RECENT_CACHE.move_to_end(session_id)
+        for limit, turns in windows.items():
+            turns.append({"role": role, "text": text, "created_at": created_at})
+            del turns[:-limit]
 
-def get_recent_turns(session_id: str = "default", limit: int = 8) -> List[Dict]:
+def _query_recent(session_id: str, limit: int) -> List[Dict]:
     with _conn() as c:
         rows = c.execute(
-            "SELECT role, content as text, created_at FROM turns WHERE session_id=? ORDER BY created_at DESC LIMIT ?",
-            (session_id, int(limit))
+            "SELECT role, content as text, created_at FROM turns WHERE session_id=? ORDER BY created_at DESC, id DESC LIMIT ?",
+            (session_id, limit)
         ).fetchall()
-    return [{"role": r["role"], "text": r["text"], "created_at": int(r["created_at"])} for r in rows][::-1]
\ No newline at end of file
+    return [{"role": r["role"], "text": r["text"], "created_at": int(r["created_at"])} for r in rows][::-1]
+
+def get_recent_turns(session_id: str = "default", limit: int = 8) -> List[Dict]:
+    limit = int(limit)
+    if limit <= 0:
+        # not a bounded window (SQLite treats a negative LIMIT as "all rows"); never cached
+        return _query_recent(session_id, limit)
+    with _RECENT_LOCK:
+        windows = _RECENT_CACHE.get(session_id)
+        if windows is None:
+            windows = _RECENT_CACHE[session_id] = {}
+            if len(_RECENT_CACHE) > _RECENT_MAX_SESSIONS:
+                _RECENT_CACHE.popitem(last=False)
+        else:
+            _RECENT_CACHE.move_to_end(session_id)
+        cached = windows.get(limit)
+        if cached is None:
+            cached = windows[limit] = _query_recent(session_id, limit)
+        return list(cached)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-import os, sqlite3, json, uuid, time, re
+import functools, os, sqlite3, json, uuid, time, re
 from typing import List, Tuple, Optional, Dict, Any
 from pathlib import Path
 import numpy as np
@@ -7,11 +7,11 @@ import numpy as np
 _OPENAI_AVAILABLE = False
 try:
     from openai import OpenAI
+    from executor.connectors.openai_shared import shared_http
     _OPENAI_AVAILABLE = True
 except Exception:
     _OPENAI_AVAILABLE = False
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 EMBEDDING_MODEL = os.getenv("CORTEX_EMBED_MODEL", "text-embedding-3-small")
 SUMMARY_MODEL = os.getenv("CORTEX_SUMMARY_MODEL", "gpt-4o-mini")
 
@@ -45,15 +45,17 @@ def init_vector_db() -> None:
     conn.commit()
     conn.close()
 
-def _client_instance():
-    if _OPENAI_AVAILABLE and OPENAI_API_KEY:
+@functools.lru_cache(maxsize=1)
+def _get_client():
+    """Built on first embed/summary call rather than at import; None without openai or a key."""
+    api_key = os.getenv("OPENAI_API_KEY", "")
+    if _OPENAI_AVAILABLE and api_key:
         try:
-            return OpenAI(api_key=OPENAI_API_KEY)
+            return OpenAI(api_key=api_key, http_client=shared_http())
         except Exception:
             return None
     return None
 
-_client = _client_instance()
 
 def _hash_fallback(text: str, dim: int = FALLBACK_DIM) -> np.ndarray:
     rng = np.random.default_rng(abs(hash(text)) % (2**32))
@@ -65,9 +67,10 @@ def embed(text: str) -> bytes:
     text = (text or "").strip()
     if not text:
         return _hash_fallback("").tobytes()
-    if _client:
+    client = _get_client()
+    if client:
         try:
-            ev = _client.embeddings.create(model=EMBEDDING_MODEL, input=text)
+            ev = client.embeddings.create(model=EMBEDDING_MODEL, input=text)
             vec = np.array(ev.data[0].embedding, dtype=np.float32)
             vec /= np.linalg.norm(vec) or 1.0
             return vec.tobytes()
@@ -96,9 +99,10 @@ def store_vector(role: str, text: str, topic: Optional[str] = None) -> None:
         conn.close()
 
 def _client_summary(text: str) -> str:
-    if _client:
+    client = _get_client()
+    if client:
         try:
-            resp = _client.chat.completions.create(
+            resp = client.chat.completions.create(
                 model=SUMMARY_MODEL,
                 messages=[
                     {"role": "system", "content": "Summarize key ideas in concise bullet points."},